@@ -1,11 +1,175 @@
+import asyncio
+import logging
+import struct
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from importlib.resources import files
+from time import monotonic, sleep
+from types import MappingProxyType
+
 import serial
 import yaml
-from pkg_resources import resource_filename
-from serial.serialutil import SerialException
+from serial.serialutil import SerialException, SerialTimeoutException
 
 from . import logger
 from .itla_errors import *
-from .utils import compute_checksum
+from .itla_status import (
+    AlarmTrigger,
+    FatalTrigger,
+    SQRTrigger,
+    StatusSnapshot,
+    _as_flag,
+)
+from .utils import compute_checksum_bytes, insert_checksums, unpack_u16
+
+# command frames are [header, register, data high, data low]
+_FRAME_U = struct.Struct(">BBH")
+_FRAME_S = struct.Struct(">BBh")
+
+# libyaml's loader is several times faster when pyyaml was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# the register yaml files that ship with the package
+_REGISTER_DIR = files("itla") / "registers"
+
+
+@lru_cache(maxsize=None)
+def _load_register_spec(register_file):
+    """Loads one of the register yaml files that ship with the package.
+
+    The parsed spec is cached so creating more laser objects doesn't
+    parse the same yaml again. The file is read through importlib.resources
+    so this also works when the package is installed zipped.
+
+    :param register_file: name of the yaml file in the registers directory
+    :returns: the register spec as a dictionary
+    """
+    with (_REGISTER_DIR / register_file).open("r") as register_yaml:
+        return yaml.load(register_yaml, Loader=_YamlLoader)
+
+
+@lru_cache(maxsize=256)
+def _read_frame(register):
+    """Builds the command frame for reading a register.
+
+    A read frame only depends on the register so each one is built once.
+    The data field is zero so signed and unsigned registers share frames.
+
+    :param register: the register to read
+    :returns: the 4 byte frame with its checksum filled in
+    """
+    return insert_checksums(_FRAME_U.pack(0, register, 0))
+
+
+def cached_threshold(getter):
+    """Decorator for the alarm threshold getters.
+
+    When `cache_thresholds` is turned on for a laser object the value is
+    only read from the laser the first time and then reused until
+    `invalidate_thresholds` is called or the laser is reconnected.
+    """
+
+    @wraps(getter)
+    def cached_getter(self):
+        if not self.cache_thresholds:
+            return getter(self)
+
+        name = getter.__name__
+        if name not in self._thresholds:
+            self._thresholds[name] = getter(self)
+
+        return self._thresholds[name]
+
+    return cached_getter
+
+
+def cached_limit(getter):
+    """Decorator for the getters of the module's capability limits
+    (power range, frequency range, ...).
+
+    These are fixed for a given laser so the value is only read from the
+    laser the first time and then reused until the laser is reconnected.
+    """
+
+    @wraps(getter)
+    def cached_getter(self):
+        name = getter.__name__
+        if name not in self._limits:
+            self._limits[name] = getter(self)
+
+        return self._limits[name]
+
+    return cached_getter
+
+
+def _close_device(device, disable_frame):
+    """Closes the serial device of a laser object that was never disconnected.
+
+    :param device: the serial device
+    :param disable_frame: a command frame that turns off the laser's output
+    or None to just close the port
+    """
+    if not device.is_open:
+        return
+
+    try:
+        if disable_frame is not None:
+            device.write(disable_frame)
+            device.read(4)
+    finally:
+        device.close()
+
+
+def _mkfn(*, fnname, register, description, readonly, signed, **_):
+    """Creates the function for reading/writing a single register."""
+    # _ here to absorb unused things. This way the yaml
+    # can contain more info without causing errors here.
+
+    # pick the frame encoder once rather than on every call
+    frame = _FRAME_S if signed else _FRAME_U
+
+    # a read always sends the same frame so it is built ahead of time
+    read_frame = _read_frame(register)
+
+    if readonly:
+
+        def reg_fun(self):
+            self._queue_frame(read_frame)
+            return self.get_response(register)
+
+    else:
+
+        def reg_fun(self, data=None):
+            if data is None:
+                self._queue_frame(read_frame)
+            else:
+                self._send_frame(frame, register, data)
+            return self.get_response(register)
+
+    reg_fun.__doc__ = description
+    reg_fun.__name__ = fnname
+    reg_fun.register = register
+    reg_fun.signed = signed
+    return reg_fun
+
+
+def _register_functions(register_files):
+    """Creates the hidden register functions for all of the registers
+    in the given register files.
+
+    :param register_files: names of yaml files in the registers directory
+    :returns: a dictionary mapping function names to register functions
+    """
+    register_functions = {}
+
+    for register_file in register_files:
+        register_spec = _load_register_spec(register_file)
+
+        for register_data in register_spec.values():
+            register_functions["_" + register_data["fnname"]] = _mkfn(**register_data)
+
+    return register_functions
 
 
 class ITLABase:
@@ -25,81 +189,164 @@ class ITLABase:
     set_frequency is my platonic ideal for the higher level functions.
     """
 
-    _nop_errors = {
-        0x00: "OK: No errors.",
-        0x01: RNIError("RNI: Register not implemented."),
-        0x02: RNWError("RNW: Register not writable"),
-        0x03: RVEError("RVE: Register Value range Error."),
-        0x04: CIPError("CIP: Command Ignored due to Pending operation"),
-        0x05: CIIError("CII: Command Ignored Initializing"),
-        0x06: EREError("ERE: Extended address Range Error (address invalid)"),
-        0x07: EROError("ERO: Extended address is read only"),
-        0x08: EXFError("EXF: Execution general failure"),
-        0x09: CIEError("CIE: Command ignored while module's optical output is enabled"),
-        0x0A: IVCError("IVC: Invalid configuration command ignored."),
-        0x0B: NOPException(),
-        0x0C: NOPException(),
-        0x0D: NOPException(),
-        0x0E: NOPException(),
-        0x0F: VSEError("VSE: Vendor specific error"),
-    }
-
-    _response_status = {
-        0x00: "OK",
-        0x01: ExecutionError("Command returned execution error."),
-        0x02: AEAException(
-            "AEA: automatic extended addressing " + "being returned or ready to write."
+    # Errors are stored as (exception class, message) and only instantiated
+    # when raised so each raise gets a fresh exception.
+    # Both tables are tuples indexed by the error/status code.
+    _nop_errors = (
+        None,  # 0x00 OK
+        (RNIError, "RNI: Register not implemented."),
+        (RNWError, "RNW: Register not writable"),
+        (RVEError, "RVE: Register Value range Error."),
+        (CIPError, "CIP: Command Ignored due to Pending operation"),
+        (CIIError, "CII: Command Ignored Initializing"),
+        (EREError, "ERE: Extended address Range Error (address invalid)"),
+        (EROError, "ERO: Extended address is read only"),
+        (EXFError, "EXF: Execution general failure"),
+        (CIEError, "CIE: Command ignored while module's optical output is enabled"),
+        (IVCError, "IVC: Invalid configuration command ignored."),
+        (NOPException, "Reserved error code 0x0B"),
+        (NOPException, "Reserved error code 0x0C"),
+        (NOPException, "Reserved error code 0x0D"),
+        (NOPException, "Reserved error code 0x0E"),
+        (VSEError, "VSE: Vendor specific error"),
+    )
+
+    _response_status = (
+        None,  # 0x00 OK
+        (ExecutionError, "Command returned execution error."),
+        (
+            AEAException,
+            "AEA: automatic extended addressing being returned or ready to write.",
         ),
-        0x03: CPException("CP: Command not complete, pending."),
-    }
-
-    def __init__(self, serial_port, baudrate, timeout=0.5, register_files=None):
+        (CPException, "CP: Command not complete, pending."),
+    )
+
+    # the low byte of statusf/statusw holds the latched bits.
+    # writing a 1 to a latched bit clears it.
+    _status_latched = 0x00FF
+
+    # alarm thresholds read by _get_threshold, filled in by subclasses as
+    # {name: ((register function name, scale), ...)}
+    _threshold_registers = MappingProxyType({})
+
+    # longest time in seconds between checks while waiting on the laser.
+    # the laser classes take this as an __init__ argument.
+    sleep_time = 0.1
+
+    # timeout and sleep_time for each of the profiles the laser classes take.
+    # low_latency gives up on a lost response after 50 ms instead of 500 ms
+    # so it needs a laser and usb serial adapter that answer quickly.
+    # _read adds the time a batch takes on the wire on top of the timeout.
+    _profiles = MappingProxyType(
+        {
+            "default": MappingProxyType({"timeout": 0.5, "sleep_time": 0.1}),
+            "low_latency": MappingProxyType({"timeout": 0.05, "sleep_time": 0.005}),
+        }
+    )
+
+    # register numbers keyed by register function name (without the leading _),
+    # filled in as register files are installed on each class
+    _registers = {}
+
+    def __init__(
+        self,
+        serial_port,
+        baudrate,
+        timeout=None,
+        register_files=None,
+        sleep_time=None,
+        profile="default",
+    ):
         """TODO describe function
 
         :param serial_port:
         :param baudrate:
-        :param timeout:
+        :param timeout: overrides the profile's timeout
+        :param register_files:
+        :param sleep_time: overrides the profile's sleep_time
+        :param profile: "default" or "low_latency", see `_profiles`
         :returns:
 
         """
+        try:
+            settings = self._profiles[profile]
+        except KeyError:
+            raise ValueError(
+                "profile must be one of: " + ", ".join(map(repr, self._profiles))
+            )
+
         self._port = serial_port
         self._baudrate = baudrate
-        self._timeout = timeout
+        self._timeout = settings["timeout"] if timeout is None else timeout
+        self.sleep_time = settings["sleep_time"] if sleep_time is None else sleep_time
         self._device = None
 
-        if register_files is None:
-            register_files = []
+        # outgoing frames are queued here until flushed to the device
+        self._txbuf = bytearray()
+        # scratch space that write frames are packed into
+        self._tx = bytearray(4)
+        self._batch_depth = 0
+
+        # identity strings that have already been read from the laser
+        self._identity = {}
+
+        # Set this to True to have transact send all of its commands before
+        # reading any of the responses, so a group of reads only costs one
+        # round trip. Only turn it on for lasers that accept a new command
+        # while earlier responses are still waiting to be read.
+        self.batch_commands = False
+
+        # Alarm thresholds are usually set once and then only read.
+        # Set this to True to only read each threshold once.
+        # Call invalidate_thresholds() after writing to a threshold register.
+        self.cache_thresholds = False
+        self._thresholds = {}
+
+        # capability limits that have already been read from the laser
+        self._limits = {}
+
+        # last fine tuning value (MHz) written to or read from the laser,
+        # None if it isn't known
+        self._fine_tuning = None
+
+        if register_files:
+            # extra registers go on a subclass made just for this object
+            # so other laser objects of the same class aren't affected.
+            cls = type(self)
+            self.__class__ = type(
+                cls.__name__, (cls,), {}, register_files=register_files
+            )
 
-        # this function creates register functions
-        def mkfn(*, fnname, register, description, readonly, signed, **_):
-            # _ here to absorb unused things. This way the yaml
-            # can contain more info without causing errors here.
-            if readonly:
+    def __init_subclass__(cls, register_files=(), **kwargs):
+        """Installs the register functions for a subclass when it is defined.
 
-                def reg_fun(self):
-                    self.send_command(register, signed=signed)
-                    return self.get_response(register)
+        Register files are given as a class keyword:
+        `class MyLaser(ITLA13, register_files=["myregisters.yaml"])`
 
-            else:
+        :param register_files: names of yaml files in the registers directory
+        """
+        super().__init_subclass__(**kwargs)
+        cls._install_registers(register_files)
+
+    @classmethod
+    def _install_registers(cls, register_files):
+        """Creates the hidden register functions described in the register
+        yaml files and attaches them to the class.
 
-                def reg_fun(self, data=None):
-                    self.send_command(register, data, signed=signed)
-                    return self.get_response(register)
+        This is done once for each class when it is defined
+        rather than every time a laser object is created.
 
-            reg_fun.__doc__ = description
-            reg_fun.__name__ = fnname
-            return reg_fun
+        :param register_files: names of yaml files in the registers directory
+        :returns: None
+        """
+        # copied so a subclass's registers don't leak into its parent's map
+        registers = dict(cls._registers)
 
-        for register_file in register_files:
-            register_file = resource_filename("itla", "registers/" + register_file)
-            with open(register_file, "r") as register_yaml:
-                register_spec = yaml.safe_load(register_yaml)
+        for fnname, reg_fun in _register_functions(register_files).items():
+            setattr(cls, fnname, reg_fun)
+            registers[fnname[1:]] = reg_fun.register
 
-                for register_name in register_spec:
-                    register_data = register_spec[register_name]
-                    setattr(
-                        ITLABase, "_" + register_data["fnname"], mkfn(**register_data)
-                    )
+        cls._registers = registers
 
     def __enter__(self):
         """TODO describe function
@@ -120,15 +367,6 @@ class ITLABase:
         """
         self.disconnect()
 
-    def __del__(self):
-        """TODO describe function
-
-        :returns:
-
-        """
-        if self._device is not None:
-            self.disconnect()
-
     def connect(self):
         """Establishes a serial connection with the port provided
 
@@ -144,6 +382,41 @@ class ITLABase:
         except SerialException:
             raise SerialException("Connection to " + self._port + " unsuccessful.")
 
+        # this could be a different laser than the last connection
+        self._identity.clear()
+        self._thresholds.clear()
+        self._limits.clear()
+        self._fine_tuning = None
+
+        # Frames are only 4 bytes so the usb serial adapter's latency timer
+        # (16 ms by default on FTDI chips) dominates every round trip.
+        # set_low_latency_mode only exists for the linux backend and can
+        # still fail for drivers that don't support it.
+        if hasattr(self._device, "set_low_latency_mode"):
+            try:
+                self._device.set_low_latency_mode(True)
+            except (OSError, ValueError):
+                logger.debug("low latency mode is not supported by %s", self._port)
+
+        # set_buffer_size only exists for the windows backend where the
+        # default 4096 byte driver buffer is small enough to split up the
+        # responses to a batch of AEA reads.
+        if hasattr(self._device, "set_buffer_size"):
+            self._device.set_buffer_size(rx_size=65536, tx_size=4096)
+
+        # If the object is garbage collected or python exits while still
+        # connected, turn the laser off and close the port. The finalizer
+        # only holds the device so it doesn't keep this object alive.
+        resena = self._registers.get("resena")
+        if resena is not None:
+            disable_frame = insert_checksums(_FRAME_U.pack(1, resena, 0))
+        else:
+            disable_frame = None
+
+        self._finalizer = weakref.finalize(
+            self, _close_device, self._device, disable_frame
+        )
+
     def disconnect(self, leave_on=False):
         """Ends the serial connection to the laser
 
@@ -154,6 +427,8 @@ class ITLABase:
         if not self._device.is_open:
             return
 
+        self._finalizer.detach()
+
         if not leave_on:
             self.disable()
 
@@ -164,89 +439,533 @@ class ITLABase:
             # There are a few ways disconnect can be called.
             # 1) It can be called purposefully.
             # 2) It can be called by ending a `with` (ie __exit__)
-            # 3) It can be called by exiting a repl or a script ending (ie. __del__).
+            # Exiting a repl or a script ending is handled by the finalizer
+            # set up in connect.
             pass
 
-    def send_command(self, register, data=None, signed=False):
+    def send_command(self, register, data=None, signed=False, flush=True):
         """Sends commands to a device.
-        This function takes the hexstring, turns it into a bytestring,
-        and writes it to the device.
+        This function packs the 4 byte command frame
+        and queues it for writing to the device.
         This function should probably be hidden from the user.
 
-        :param device: Should be a Serial object that you can write to.
-        :param hexstring: a hexstring to send to the device
+        :param register: the register to read from or write to
+        :param data: the data to write. If None the register is read.
+        :param signed: whether the data should be encoded as a signed integer
+        :param flush: write the queued commands to the device immediately.
+        This is ignored inside of a `batch()` block.
+        :returns: nothing
+        """
+
+        if data is None:
+            self._queue_frame(_read_frame(register), flush)
+        else:
+            frame = _FRAME_S if signed else _FRAME_U
+            self._send_frame(frame, register, data, flush=flush)
+
+    def _send_frame(self, frame, register, data, flush=True):
+        """Packs a write command into the scratch buffer, adds the checksum
+        and queues it.
+
+        :param frame: the struct used to pack the frame
+        :param register: the register to write to
+        :param data: the data to write
+        :param flush: write the queued commands to the device immediately.
         :returns: nothing
         """
+        command = self._tx
+        frame.pack_into(command, 0, 1, register, data)
 
-        write = data is not None
+        # the checksum goes in the upper nibble of the header
+        command[0] |= compute_checksum_bytes(command) << 4
 
-        # convert to register to a bytestring
-        register_bytes = register.to_bytes(1, "big")
+        self._queue_frame(command, flush=flush)
 
-        # convert data to bytestring
-        if write:
-            data_bytes = data.to_bytes(2, "big", signed=signed)
+    def _queue_frame(self, command, flush=True):
+        """Queues a complete frame, checksum included, for the device.
 
-        else:
-            data_bytes = (0).to_bytes(2, "big")
+        :param command: the 4 byte frame
+        :param flush: write the queued commands to the device immediately.
+        :returns: nothing
+        """
+        self._txbuf += command
+
+        if flush and not self._batch_depth:
+            self.flush()
+
+    def send_commands(self, commands, flush=True):
+        """Sends several commands to the device at once.
+
+        The frames are built together and their checksums are computed
+        in one pass over the whole buffer instead of frame by frame.
+        Responses still need to be read with `get_response` in the same order.
+
+        :param commands: an iterable of (register, data) or
+        (register, data, signed) tuples. data may be None to read the register.
+        :param flush: write the queued commands to the device immediately.
+        This is ignored inside of a `batch()` block.
+        :returns: nothing
+        """
+        frames = bytearray()
+
+        for register, data, *signed in commands:
+            if data is None:
+                frames += _FRAME_U.pack(0, register, 0)
+            elif signed and signed[0]:
+                frames += _FRAME_S.pack(1, register, data)
+            else:
+                frames += _FRAME_U.pack(1, register, data)
+
+        self._txbuf += insert_checksums(frames)
+
+        if flush and not self._batch_depth:
+            self.flush()
+
+    def transact(self, commands):
+        """Sends several commands and reads back their responses.
+
+        By default each command is sent and its response read before the
+        next one is sent, so an error stops the commands after it from being
+        sent at all. With `batch_commands` turned on all of the commands are
+        sent together and their responses are read back with a single read.
+
+        Not for AEA registers since their data is read with further commands.
+
+        :param commands: an iterable of (register, data) or
+        (register, data, signed) tuples. data may be None to read the register.
+        :returns: a list with the data bytes of each response, in order
+        """
+        commands = list(commands)
+
+        if not self.batch_commands:
+            responses = []
 
-        # compute the checksum
-        checksum = compute_checksum(
-            (write.to_bytes(1, "big") + register_bytes + data_bytes).hex()
+            for register, data, *signed in commands:
+                self.send_command(register, data, bool(signed and signed[0]))
+                responses.append(self.get_response(register))
+
+            return responses
+
+        self.send_commands(commands)
+
+        return self.get_responses(register for register, *_ in commands)
+
+    def pipeline(self, commands):
+        """Sends a sequence of commands while keeping the next one in flight.
+
+        Each command is written out before the response to the previous one
+        is read so the laser doesn't sit idle waiting on the host between
+        commands. The laser must accept a command while its previous
+        response is still being read, and AEA registers should not be
+        included since reading AEA data sends commands of its own.
+
+        :param commands: an iterable of (register, data) or
+        (register, data, signed) tuples. data may be None to read the register.
+        :returns: a list with the data bytes of each response, in order
+        """
+        commands = [
+            (register, data, bool(signed and signed[0]))
+            for register, data, *signed in commands
+        ]
+        responses = []
+
+        if commands:
+            self.send_command(*commands[0])
+
+        for i, (register, _, _) in enumerate(commands):
+            # queue the next command; get_response flushes it before reading
+            if i + 1 < len(commands):
+                self.send_command(*commands[i + 1], flush=False)
+
+            responses.append(self.get_response(register))
+
+        return responses
+
+    def flush(self):
+        """Writes all queued commands to the device in a single write call."""
+        if self._txbuf:
+            self._device.write(bytes(self._txbuf))
+            self._txbuf.clear()
+
+    @contextmanager
+    def batch(self):
+        """Context manager that holds back commands sent within it
+        so they are written to the device together.
+
+        Commands are flushed when the block exits or when a response is read.
+
+        ```python
+        with laser.batch():
+            laser.send_command(0x31)
+            laser.send_command(0x35)
+        pwr = laser.get_response(0x31)
+        fcf1 = laser.get_response(0x35)
+        ```
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def invalidate_identity(self):
+        """Forgets the cached identity strings (manufacturer, model, ...)
+        so they are read from the laser again. This happens on its own
+        on connect and after a reset."""
+        self._identity.clear()
+
+    def _get_identity(self, fnname):
+        """Reads one of the identity strings (manufacturer, model, ...).
+
+        These can't change while connected so each is only read
+        from the laser the first time it is asked for.
+
+        :param fnname: the name of the AEA register function without the _
+        :returns: the decoded string
+        """
+        identity = self._identity.get(fnname)
+
+        if identity is None:
+            identity = getattr(self, "_" + fnname)().decode("utf-8")
+            self._identity[fnname] = identity
+
+        return identity
+
+    def get_threshold_raw(self, name):
+        """Reads an alarm threshold as an integer in register units.
+
+        Monitoring code can compare readings against this directly
+        instead of converting every reading to a float.
+        The value is in steps of 1/scale of the threshold's units, where
+        scale is the largest scale listed for it in `_threshold_registers`.
+
+        :param name: the threshold's key in `_threshold_registers`
+        (fatal_power, warning_freq, ...)
+        :returns: the threshold as an integer
+        """
+        registers = self._threshold_registers[name]
+        responses = self.transact(
+            (self._registers[fnname], None) for fnname, _ in registers
+        )
+
+        return self._threshold_raw(registers, responses)
+
+    def _threshold_raw(self, registers, responses):
+        """Combines the responses of a threshold's registers into one integer,
+        see `get_threshold_raw`.
+
+        :param registers: the threshold's entry in `_threshold_registers`
+        :param responses: the data bytes of the registers' responses, in order.
+        Only one response is taken per register so this can be an iterator
+        that holds more responses after them.
+        :returns: the threshold as an integer
+        """
+        scale = max(scale for _, scale in registers)
+
+        # registers goes first so zip stops without taking an extra response
+        return sum(
+            unpack_u16(response)[0] * (scale // register_scale)
+            for (_, register_scale), response in zip(registers, responses)
+        )
+
+    def _get_threshold(self, name):
+        """Reads an alarm threshold described in `_threshold_registers`.
+
+        Thresholds split over more than one register are read with one
+        `transact`.
+
+        :param name: the threshold's key in `_threshold_registers`
+        :returns: the scaled threshold value
+        """
+        scale = max(scale for _, scale in self._threshold_registers[name])
+
+        return self.get_threshold_raw(name) / scale
+
+    def get_status_bundle(self):
+        """Reads the thermal alarm thresholds and the SRQ, fatal and alarm
+        triggers with one `transact`, so with `batch_commands` they only cost
+        one round trip. Handy for status dashboards that poll all of them,
+        the getters for each still read just their own register.
+
+        :returns: a StatusSnapshot named tuple of the fatal and warning thermal
+        thresholds in degrees C followed by the SQRTrigger, FatalTrigger and
+        AlarmTrigger flags
+        """
+        thresholds = [
+            self._threshold_registers[name] for name in ("fatal_therm", "warning_therm")
+        ]
+        fnnames = [fnname for registers in thresholds for fnname, _ in registers]
+        fnnames += ["srqt", "fatalt", "almt"]
+
+        responses = iter(
+            self.transact((self._registers[fnname], None) for fnname in fnnames)
         )
 
-        # compute and convery header to bytestring
-        header = checksum * 16 + write
-        header_bytes = header.to_bytes(1, "big")
+        bundle = [
+            self._threshold_raw(registers, responses)
+            / max(scale for _, scale in registers)
+            for registers in thresholds
+        ]
+        bundle += [
+            _as_flag(flag_class, unpack_u16(response)[0])
+            for flag_class, response in zip(
+                (SQRTrigger, FatalTrigger, AlarmTrigger), responses
+            )
+        ]
+
+        return StatusSnapshot(*bundle)
+
+    def _poll(self, done, timeout=None):
+        """Calls done() until it returns True.
+
+        The first re-check is after 1 ms and the delay then doubles up to
+        self.sleep_time seconds between checks. If sleep_time is None
+        done() is called again right away.
+
+        :param done: a function with no arguments returning True when
+        the wait is over
+        :param timeout: seconds to wait before giving up with a TimeoutError.
+        None waits for as long as it takes.
+        :returns: None
+        """
+        if timeout is not None:
+            deadline = monotonic() + timeout
+        delay = 0.001
+
+        while not done():
+            if timeout is not None and monotonic() > deadline:
+                raise TimeoutError(f"Still waiting after {timeout} s.")
+
+            if self.sleep_time is not None:
+                sleep(min(delay, self.sleep_time))
+                delay *= 2
+
+    def invalidate_thresholds(self):
+        """Forgets the cached alarm thresholds so they are read
+        from the laser again. See `cache_thresholds`. This happens on its
+        own on connect and after a reset."""
+        self._thresholds.clear()
+
+    def _get_status(self, fnname, flag_class, reset=False):
+        """Reads a flag register (statusf, srqt, resena, ...) as a flag.
+
+        With reset the latched bits of statusf/statusw are cleared by a write
+        sent in the same `transact` as the read.
+
+        :param fnname: the name of the status register function without the _
+        :param flag_class: the IntFlag class describing the register's bits
+        :param reset: resets/clears latching errors
+        :returns: the status as an instance of flag_class
+        """
+        register = self._registers[fnname]
+
+        if reset:
+            response, _ = self.transact(
+                [(register, None), (register, self._status_latched)]
+            )
+        else:
+            self.send_command(register)
+            response = self.get_response(register)
+
+        status = unpack_u16(response)[0]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current %s status: %d", flag_class.__name__, status)
+
+        return _as_flag(flag_class, status)
+
+    def _read(self, size):
+        """Reads size bytes from the device.
+
+        The timeout is how long to wait on the laser, on top of that a read
+        gets the time it takes to send its commands and responses over the
+        wire, which matters for large batches at low baudrates.
+
+        If fewer than size bytes arrive in that time whatever did arrive
+        is thrown away along with anything still in the input buffer, so late
+        responses don't get mixed up with the next exchange.
+
+        :param size: the number of bytes to read
+        :returns: the bytes read
+        :raises SerialTimeoutException: if fewer than size bytes were read
+        """
+        device = self._device
+
+        # the commands and responses are each size bytes long and a byte
+        # takes 10 bits on the wire with its start and stop bits
+        timeout = self._timeout + 20 * size / self._baudrate
+
+        # pyserial reconfigures the port whenever the timeout is set
+        if device.timeout != timeout:
+            device.timeout = timeout
+
+        response = device.read(size)
+
+        if len(response) < size:
+            device.reset_input_buffer()
+            raise SerialTimeoutException(
+                f"Communication error expected {size} bytes from the laser "
+                + f"got {len(response)} before timing out"
+            )
 
-        # form full command and send.
-        command = header_bytes + register_bytes + data_bytes
-        self._device.write(command)
+        return response
 
     def get_response(self, register):
         """This function should read from self._device. This should be called
+        after sending a command with `send_command`.
 
-        :param register:
-        :returns: ???
+        :param register: the register the command was sent to
+        :returns: the data bytes of the response
 
         """
+        # make sure the command we are waiting on has actually been sent
+        self.flush()
+
         # read four bytes
-        response = self._device.read(4)
+        response = self._read(4)
+
+        return self._parse_response(response, register)
+
+    def get_responses(self, registers):
+        """Reads the responses to several queued commands with a single read.
+
+        :param registers: the registers the commands were sent to, in order
+        :returns: a list with the data bytes of each response
+
+        """
+        registers = list(registers)
+
+        self.flush()
+        response = self._read(4 * len(registers))
+
+        return [
+            self._parse_response(response[4 * i : 4 * i + 4], register)
+            for i, register in enumerate(registers)
+        ]
+
+    def get_response_status(self, register):
+        """Like `get_response` but returns the response status instead of
+        raising an exception for it.
+
+        This is for loops where a non-OK status is an expected result.
+        AEA responses are not followed up so the data is the AEA length.
+
+        :param register: the register the command was sent to
+        :returns: a tuple of the status code (0 OK, 1 XE, 2 AEA, 3 CP)
+        and the data bytes of the response
+        """
+        self.flush()
+
+        response = self._read(4)
+
+        return self._unpack_response(response, register)
+
+    def _parse_response(self, response, register):
+        """Checks a 4 byte response frame and returns its data bytes.
+
+        :param response: the response frame
+        :param register: the register the command was sent to
+        :returns: the data bytes of the response
+
+        """
+        status, data = self._unpack_response(response, register)
 
-        logger.debug(f"response: {response.hex()}")
+        if status == 0x00:
+            return data
 
+        if status == 0x02:
+            # AEA: the data field holds the number of bytes waiting in AEA-EAR
+            return self.read_aea(unpack_u16(data)[0])
+
+        error_class, message = self._response_status[status]
+        raise error_class(message)
+
+    def _raise_nop_error(self, response, status=0x00):
+        """Raises the error that a response to nop reports, if there is one.
+
+        :param response: the data bytes of the nop response
+        :param status: the status code of the nop response, for callers that
+        read it with get_response_status instead of raising on it
+        :returns: None
+
+        """
+        if status != 0x00:
+            error_class, message = self._response_status[status]
+            raise error_class(message)
+
+        # the error code is the low nibble of the data
+        error_field = response[-1] & 0x0F
+        if error_field:
+            error_class, message = self._nop_errors[error_field]
+            raise error_class(message)
+
+    def _unpack_response(self, response, register):
+        """Checks the checksum of a 4 byte response frame and splits it
+        into its status and data bytes.
+
+        :param response: the response frame
+        :param register: the register the command was sent to
+        :returns: a tuple of the status code and the data bytes
+
+        """
         # get the checksum and ... check it.
-        checksum = int(response.hex()[0], 16)
-        computed_checksum = compute_checksum(response.hex())
+        checksum = response[0] >> 4
+        computed_checksum = compute_checksum_bytes(response)
 
         if computed_checksum != checksum:
             raise Exception(
-                f"Communication error expected {checksum} got " + f"{computed_checksum}"
+                f"Communication error expected {checksum} got "
+                + f"{computed_checksum} in response {response.hex()}"
             )
 
-        status = int(f"{response[0]:08b}"[-2:], 2)
-        logger.debug(f"status: {status}")
-
-        try:
-            raise self._response_status[status]
-
-        except TypeError:
-            # a type error occurs if we try to raise "OK"
-            # in this situation we should just pass.
-            pass
+        # the status is held in the lowest two bits of the header
+        status = response[0] & 0x03
 
-        except AEAException:
-            response = self.read_aea()
-            return response
+        # checked first so the hex string is only made when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("response: %s status: %d", response.hex(), status)
 
-        if register != response[1]:
+        if status == 0x00 and register != response[1]:
             raise Exception(
                 "The returned register does not match "
                 + "the register sent to the device. "
                 + f"Got {response[1]} expected {register}."
             )
 
-        return response[2:]
+        return status, response[2:]
+
+    async def set_frequency_async(self, freq):
+        """Awaitable version of `set_frequency`.
+
+        The blocking call is run in a worker thread so the sleeps while the
+        laser finishes tuning don't hold up the event loop. This lets several
+        lasers, each on their own port, be tuned at the same time.
+
+        Don't run two of these on the same laser object at once.
+
+        :param freq: The desired frequency setting in THz.
+        :returns: None
+        """
+        await asyncio.to_thread(self.set_frequency, freq)
+
+    async def enable_async(self):
+        """Awaitable version of `enable` that runs in a worker thread."""
+        await asyncio.to_thread(self.enable)
+
+    async def wait_async(self):
+        """Awaitable version of `wait` that runs in a worker thread."""
+        await asyncio.to_thread(self.wait)
+
+    async def get_status_bundle_async(self):
+        """Awaitable version of `get_status_bundle` that runs in a worker
+        thread, so lasers on separate ports can be polled at the same time
+        with asyncio.gather.
+
+        :returns: the same StatusSnapshot as `get_status_bundle`
+        """
+        return await asyncio.to_thread(self.get_status_bundle)
 
     def upgrade_firmware(self, firmware_file):
         """This function should update the firmware for the laser."""
@@ -256,7 +975,10 @@ class ITLABase:
         # 2) set baudrate to 115200
         # 3) disconnect and reconnect at update baudrate
         # 4) send dlconfig signal
-        # 5) ????
+        # 5) ???? - once the transfer format is known, build the write frames
+        #    for the whole image up front and fill in all of their checksums
+        #    with a single insert_checksums call rather than frame by frame.
+        #    Then send them in large chunks with send_commands/get_responses.
         # 6) profit
         raise Warning("this is not implemented yet.")
 
@@ -1,12 +1,24 @@
 from time import sleep
+from types import MappingProxyType
 
 from . import logger
-from .itla import ITLABase
+from .itla import ITLABase, cached_limit, cached_threshold
 from .itla_errors import *
 from .itla_status import *
+from .utils import iter_unpack_s16, unpack_s16, unpack_u16
 
+# DitherE payloads: bit 1 enables digital dither, bits 5:4 pick the waveform
+# (0 sinusoidal, 1 triangular).
+_DITHER_ENABLE_CODES = {
+    "sinusoidal": 0 << 4 | 1 << 1,
+    "sinusoid": 0 << 4 | 1 << 1,
+    "sin": 0 << 4 | 1 << 1,
+    "triangular": 1 << 4 | 1 << 1,
+    "tri": 1 << 4 | 1 << 1,
+}
 
-class ITLA13(ITLABase):
+
+class ITLA13(ITLABase, register_files=["registers_itla.yaml"]):
     """
     A class that represents the ITLA13
     and exposes a user friendly API for controlling functionality.
@@ -30,7 +42,13 @@ class ITLA13(ITLABase):
     """
 
     def __init__(
-        self, serial_port, baudrate, timeout=0.5, register_files=None, sleep_time=0.1
+        self,
+        serial_port,
+        baudrate,
+        timeout=None,
+        register_files=None,
+        sleep_time=None,
+        profile="default",
     ):
         """Initializes the ITLA12 object.
 
@@ -39,21 +57,25 @@ class ITLA13(ITLABase):
         :param baudrate: The baudrate for communication. I have primarily seen
         lasers using 9600 as the default and then higher for firmware upgrades.
         This may be laser specific.
-        :param timeout: How long should we wait to receive a response from the laser
+        :param timeout: How long should we wait to receive a response from the laser.
+        Defaults to 0.5 s, or 0.05 s with the low_latency profile.
         :param register_files: Any additional register files you would like to include
         beyond the default MSA-01.3 defined registers. These must be in a yaml format as
         described in the project's README.
-        :param sleep_time: time in seconds. Use in wait function
+        :param sleep_time: time in seconds. Use in wait function.
+        Defaults to 0.1 s, or 5 ms with the low_latency profile.
+        :param profile: "default" or "low_latency". low_latency shortens the
+        timeout and sleep_time so a lost response or a finished operation is
+        noticed sooner. Only use it with a laser and usb serial adapter that
+        respond quickly, a slow one will see timeouts.
         """
-        if register_files is None:
-            register_files = []
-
-        register_files = ["registers_itla12.yaml", *register_files]
-
-        self.sleep_time = sleep_time
-
         super().__init__(
-            serial_port, baudrate, timeout=timeout, register_files=register_files
+            serial_port,
+            baudrate,
+            timeout=timeout,
+            register_files=register_files,
+            sleep_time=sleep_time,
+            profile=profile,
         )
 
     def nop(self, data=None):
@@ -76,9 +98,7 @@ class ITLA13(ITLABase):
         else:
             response = self._nop()
 
-        error_field = int(response.hex()[-1], 16)
-        if bool(error_field):
-            raise self._nop_errors[error_field]
+        self._raise_nop_error(response)
 
     def enable(self):
         """Enables laser optical output.
@@ -107,6 +127,9 @@ class ITLA13(ITLABase):
 
         """
         self._resena(Resena.MR)
+        self.invalidate_identity()
+        self.invalidate_thresholds()
+        self._fine_tuning = None
 
     def soft_reset(self):
         """TODO describe function
@@ -115,13 +138,15 @@ class ITLA13(ITLABase):
 
         """
         self._resena(Resena.SR)
+        self.invalidate_identity()
+        self.invalidate_thresholds()
+        self._fine_tuning = None
 
     def get_reset_enable(self):
         """
         Return ResEna register.
         """
-        response = self._resena()
-        return Resena(int.from_bytes(response, "big"))
+        return self._get_status("resena", Resena)
 
     def set_alarm_during_tuning(self):
         """Set alarm during tuning
@@ -139,10 +164,9 @@ class ITLA13(ITLABase):
         """
         Return MCB register.
         """
-        response = self._mcb()
-        return MCB(int.from_bytes(response, "big"))
+        return self._get_status("mcb", MCB)
 
-    def is_disabled(self):
+    def is_disabled(self, fatal_trigger=None, resena=None, mcb=None):
         """
         Return if disabled.
 
@@ -150,11 +174,28 @@ class ITLA13(ITLABase):
 
         For some lasers, FatalError.DIS is not triggered (even if TriggerT allows it).
         Consider overwriting this methods and monitoring FatalError.ALM.
-        """
-        fatal_error = self.get_error_fatal()
-        fatal_trigger = self.get_fatal_trigger()
-        resena = self.get_reset_enable()
-        mcb = self.get_configuration_behavior()
+
+        If fatal_trigger, resena and mcb are all given only statusf is read.
+        The wait_until functions use this to read them once before polling.
+
+        :param fatal_trigger: the FatalTrigger flags to use instead of reading fatalt
+        :param resena: the Resena flags to use instead of reading resena
+        :param mcb: the MCB flags to use instead of reading mcb
+        """
+        if fatal_trigger is None or resena is None or mcb is None:
+            # all four reads go through one transact, see batch_commands
+            responses = self.transact(
+                (self._registers[fnname], None)
+                for fnname in ("statusf", "fatalt", "resena", "mcb")
+            )
+            fatal_error, fatal_trigger, resena, mcb = (
+                flag_class(unpack_u16(response)[0])
+                for flag_class, response in zip(
+                    (FatalError, FatalTrigger, Resena, MCB), responses
+                )
+            )
+        else:
+            fatal_error = self._get_status("statusf", FatalError)
 
         sdf = MCB.SDF in mcb
         sena = Resena.SENA in resena
@@ -172,99 +213,130 @@ class ITLA13(ITLABase):
         """
         returns a string containing the device type.
         """
-        response_bytes = self._devtyp()
-
-        return response_bytes.decode("utf-8")
+        return self._get_identity("devtyp")
 
     def get_manufacturer(self):
         """
         Return's a string containing the manufacturer's name.
         """
-        response_bytes = self._mfgr()
-
-        return response_bytes.decode("utf-8")
+        return self._get_identity("mfgr")
 
     def get_model(self):
         """
         return's the model as a string
         """
-        response_bytes = self._model()
-
-        return response_bytes.decode("utf-8")
+        return self._get_identity("model")
 
     def get_serialnumber(self):
         """
         returns the serial number
         """
-        response_bytes = self._serno()
-
-        return response_bytes.decode("utf-8")
+        return self._get_identity("serno")
 
     def get_manufacturing_date(self):
         """returns the manufacturing date"""
-        response_bytes = self._mfgdate()
-
-        return response_bytes.decode("utf-8")
+        return self._get_identity("mfgdate")
 
     def get_firmware_release(self):
         """
         returns a manufacturer specific firmware release
         """
-        response_bytes = self._release()
-
-        return response_bytes.decode("utf-8")
+        return self._get_identity("release")
 
     def get_backwardscompatibility(self):
         """
         returns a manufacturer specific firmware backwards compatibility
         as a null terminated string
         """
-        response_bytes = self._relback()
-
-        return response_bytes.decode("utf-8")
+        return self._get_identity("relback")
 
-    def read_aea(self):
+    def read_aea(self, length=None):
         """
-        reads the AEA register data until an execution error is thrown.
-        """
-        aea_response = b""
-        try:
-            while True:
-                aea_response += self._aea_ear()
+        reads the AEA register data.
 
-        except ExecutionError as ee:
-            try:
-                self.nop()
+        If the number of bytes waiting is known the AEA-EAR reads are all
+        done with one `transact`.
+        Otherwise it reads until the laser returns an execution error.
 
-            except EREError as eree:
-                # If this throws an ERE error then we have completed reading AEA
-                pass
+        :param length: the number of bytes waiting in AEA-EAR
+        """
+        if length is not None:
+            commands = [(self._registers["aea_ear"], None)] * ((length + 1) // 2)
 
-            except NOPException as nop_e:
-                raise nop_e
+            return b"".join(self.transact(commands))[:length]
 
-        return aea_response
+        register = self._registers["aea_ear"]
+        aea_response = bytearray()
 
-    def wait(self):
-        """Wait until operation is complete. It check if the operation is completed every self.sleep_time seconds."""
         while True:
-            try:
-                self.nop()
-            except CPException:
-                if self.sleep_time is not None:
-                    sleep(self.sleep_time)
-            else:
+            self.send_command(register)
+            status, data = self.get_response_status(register)
+            if status != 0x00:
                 break
+            aea_response += data
+
+        if status != 0x01:
+            error_class, message = self._response_status[status]
+            raise error_class(message)
+
+        # Reading past the end gives an execution error.
+        # nop should then report ERE, anything else is a real error.
+        try:
+            self.nop()
+        except EREError:
+            pass
+
+        return bytes(aea_response)
+
+    def wait(self, timeout=None):
+        """Wait until operation is complete.
+
+        nop is polled with the backoff from `_poll`, so quick operations
+        don't have to wait out a whole sleep_time.
+
+        :param timeout: seconds to wait before giving up with a TimeoutError.
+        None waits for as long as it takes.
+        """
+        register = self._registers["nop"]
+        status = response = None
+
+        def done():
+            nonlocal status, response
+
+            # check the pending status directly
+            # rather than raising and catching a CPException every time
+            self.send_command(register)
+            status, response = self.get_response_status(register)
+
+            return status != 0x03
+
+        self._poll(done, timeout)
+
+        # otherwise this is handled the same as a response to nop()
+        self._raise_nop_error(response, status)
+
+    def _get_enable_config(self):
+        """Reads the fatalt, resena and mcb flags used by is_disabled.
+        Only statusf changes on its own so these are read once before polling.
+
+        :returns: a tuple of the FatalTrigger, Resena and MCB flags
+        """
+        responses = self.transact(
+            (self._registers[fnname], None) for fnname in ("fatalt", "resena", "mcb")
+        )
+
+        return tuple(
+            flag_class(unpack_u16(response)[0])
+            for flag_class, response in zip((FatalTrigger, Resena, MCB), responses)
+        )
 
     def wait_until_enabled(self):
-        while self.is_disabled():
-            if self.sleep_time is not None:
-                sleep(self.sleep_time)
+        config = self._get_enable_config()
+        self._poll(lambda: self.is_enabled(*config))
 
     def wait_until_disabled(self):
-        while self.is_enabled():
-            if self.sleep_time is not None:
-                sleep(self.sleep_time)
+        config = self._get_enable_config()
+        self._poll(lambda: self.is_disabled(*config))
 
     def set_power(self, pwr_dBm):
         """Sets the power of the ITLA laser. Units of dBm.
@@ -283,9 +355,10 @@ class ITLA13(ITLABase):
             except RVEError as error:
                 logger.error(
                     "The provided power %.2f dBm is outside of the range for this device. "
-                    "The power is currently set to: %.2f dBm.",
+                    "The power must be within the range %.2f - %.2f dBm.",
                     pwr_dBm,
-                    self.get_power_setting(),
+                    self.get_power_min(),
+                    self.get_power_max(),
                 )
                 raise error
 
@@ -297,7 +370,7 @@ class ITLA13(ITLABase):
         """
         # Gets power setting, not actual optical output power.
         response = self._pwr()
-        return int.from_bytes(response, "big", signed=True) / 100
+        return unpack_s16(response)[0] / 100
 
     def get_power_output(self):
         """Gets the actual optical output power of the laser.
@@ -308,8 +381,9 @@ class ITLA13(ITLABase):
         """
         response = self._oop()
 
-        return int.from_bytes(response, "big", signed=True) / 100
+        return unpack_s16(response)[0] / 100
 
+    @cached_limit
     def get_power_min(self):
         """Gets the minimum optical power output of the module. Units dBm.
 
@@ -317,8 +391,9 @@ class ITLA13(ITLABase):
 
         """
         response = self._opsl()
-        return int.from_bytes(response, "big", signed=True) / 100
+        return unpack_s16(response)[0] / 100
 
+    @cached_limit
     def get_power_max(self):
         """Gets the maximum optical power output of the module. Units dBm.
 
@@ -326,7 +401,7 @@ class ITLA13(ITLABase):
 
         """
         response = self._opsh()
-        return int.from_bytes(response, "big", signed=True) / 100
+        return unpack_s16(response)[0] / 100
 
     def set_fcf(self, freq):
         """
@@ -338,18 +413,17 @@ class ITLA13(ITLABase):
         # convert frequency to MHz
         freq = int(freq * 1e6)
 
-        freq_str = str(freq)
-        fcf1 = int(freq_str[0:3])
-        fcf2 = int(freq_str[3:7])
-        fcf3 = int(freq_str[7:])
+        # THz, then 0.1 GHz steps, then the remaining MHz
+        fcf1, freq = divmod(freq, 1000000)
+        fcf2, fcf3 = divmod(freq, 100)
 
         try:
-            # is it better to split these into their own try/except blocks?
+            # written one at a time so an error stops the writes after it
             self._fcf1(fcf1)
             self._fcf2(fcf2)
             self._fcf3(fcf3)
 
-        except ExecutionError:
+        except ExecutionError as execution_error:
             try:
                 self.nop()
             except RVEError as error:
@@ -370,6 +444,9 @@ class ITLA13(ITLABase):
                 )
                 raise error
 
+            # nop didn't say what went wrong so pass on the original error
+            raise execution_error
+
     def set_frequency(self, freq):
         """Sets the frequency of the laser in TeraHertz.
 
@@ -384,11 +461,20 @@ class ITLA13(ITLABase):
 
         Disable the laser before calling this function.
 
+        The fine tuning value is remembered from the last call to
+        `set_fine_tuning` or `get_fine_tuning` so it only has to be read once.
+        Writing to `_ftf` directly bypasses that, call `get_fine_tuning`
+        afterwards so this doesn't use a stale value.
+
         :param freq: The desired frequency setting in THz.
         :returns: None
         """
         # This does a check so this only runs if fine tuning has been turned on.
-        if self.get_fine_tuning() != 0:
+        # The laser is only asked if we don't already know the value.
+        if self._fine_tuning is None:
+            self.get_fine_tuning()
+
+        if self._fine_tuning:
             # Set the fine tuning off!
             while True:
                 try:
@@ -411,18 +497,25 @@ class ITLA13(ITLABase):
         except CPException:
             self.wait()
 
-    def get_fcf(self):
-        """Get the currently set first channel frequency."""
-        response = self._fcf1()
-        fcf1 = int.from_bytes(response, "big")
+    def _get_frequency_registers(self, thz_reg, ghz_reg, mhz_reg):
+        """Reads a frequency that is split over THz, 0.1 GHz and MHz registers.
+        The reads are done with one `transact`.
 
-        response = self._fcf2()
-        fcf2 = int.from_bytes(response, "big")
+        :param thz_reg: name of the THz register
+        :param ghz_reg: name of the 0.1 GHz register
+        :param mhz_reg: name of the MHz register
+        :returns: the frequency in THz
+        """
+        responses = self.transact(
+            (self._registers[name], None) for name in (thz_reg, ghz_reg, mhz_reg)
+        )
+        thz, ghz, mhz = (unpack_u16(response)[0] for response in responses)
 
-        response = self._fcf3()
-        fcf3 = int.from_bytes(response, "big")
+        return thz + ghz * 1e-4 + mhz * 1e-6
 
-        return fcf1 + fcf2 * 1e-4 + fcf3 * 1e-6
+    def get_fcf(self):
+        """Get the currently set first channel frequency."""
+        return self._get_frequency_registers("fcf1", "fcf2", "fcf3")
 
     def get_frequency(self):
         """gets the current laser operating frequency with channels
@@ -431,32 +524,15 @@ class ITLA13(ITLABase):
         :returns:
 
         """
-        response = self._lf1()
-        lf1 = int.from_bytes(response, "big")
-
-        response = self._lf2()
-        lf2 = int.from_bytes(response, "big")
-
-        response = self._lf3()
-        lf3 = int.from_bytes(response, "big")
-
-        return lf1 + lf2 * 1e-4 + lf3 * 1e-6
+        return self._get_frequency_registers("lf1", "lf2", "lf3")
 
     def dither_enable(self, waveform="sinusoidal"):
         """ """
-        if (
-            waveform.lower() != "sinusoid"
-            or waveform.lower() != "triangular"
-            or waveform.lower() != "sin"
-            or waveform.lower() != "tri"
-        ):
+        try:
+            data = _DITHER_ENABLE_CODES[waveform.lower()]
+        except KeyError:
             raise ValueError("waveform must be 'sinusoidal', or 'triangular'")
 
-        data = [0] * 16
-        # bit 1 Digital Dither Enable bit
-        data[1] = 1
-        data = int("".join(str(x) for x in data[::-1]), 2)
-
         self._dithere(data)
 
     def dither_disable(self):
@@ -465,9 +541,7 @@ class ITLA13(ITLABase):
         """
         # i think that we should try to preserve other bits rather than setting all
         # data to zero across the board
-        data = [0] * 16
-        data = int("".join(str(x) for x in data[::-1]), 2)
-        self._dithere(data)
+        self._dithere(0)
 
     def set_dither_rate(self, rate):
         """
@@ -481,7 +555,7 @@ class ITLA13(ITLABase):
         get dither rate, utilizes DitherR register
         """
         response = self._ditherr()
-        return int.from_bytes(response, "big")
+        return unpack_u16(response)[0]
 
     def set_dither_frequency(self, rate):
         """
@@ -496,7 +570,7 @@ class ITLA13(ITLABase):
         get dither modulation frequency, utilizes DitherF register
         """
         response = self._ditherf()
-        return int.from_bytes(response, "big")
+        return unpack_u16(response)[0]
 
     def set_dither_amplitude(self, amplitude):
         """
@@ -511,7 +585,7 @@ class ITLA13(ITLABase):
         get dither modulation amplitude, utilizes DitherA register
         """
         response = self._dithera()
-        return int.from_bytes(response, "big")
+        return unpack_u16(response)[0]
 
     def get_temp(self):
         """Returns the current primary control temperature in deg C.
@@ -520,44 +594,29 @@ class ITLA13(ITLABase):
 
         """
         response = self._ctemp()
-        temp_100 = int.from_bytes(response, "big")
+        temp_100 = unpack_u16(response)[0]
 
         return temp_100 / 100
 
+    @cached_limit
     def get_frequency_min(self):
         """command to read minimum frequency supported by the module
 
         :returns:
 
         """
-        response = self._lfl1()
-        lfl1 = int.from_bytes(response, "big")
-
-        response = self._lfl2()
-        lfl2 = int.from_bytes(response, "big")
-
-        response = self._lfl3()
-        lfl3 = int.from_bytes(response, "big")
-
-        return lfl1 + lfl2 * 1e-4 + lfl3 * 1e-6
+        return self._get_frequency_registers("lfl1", "lfl2", "lfl3")
 
+    @cached_limit
     def get_frequency_max(self):
         """command to read maximum frequency supported by the module
 
         :returns:
 
         """
-        response = self._lfh1()
-        fcf1 = int.from_bytes(response, "big")
-
-        response = self._lfh2()
-        fcf2 = int.from_bytes(response, "big")
-
-        response = self._lfh3()
-        fcf3 = int.from_bytes(response, "big")
-
-        return fcf1 + fcf2 * 1e-4 + fcf3 * 1e-6
+        return self._get_frequency_registers("lfh1", "lfh2", "lfh3")
 
+    @cached_limit
     def get_grid_min(self):
         """command to read minimum grid supported by the module
 
@@ -565,8 +624,8 @@ class ITLA13(ITLABase):
 
         """
         try:
-            freq_lgrid = int.from_bytes(self._lgrid(), "big", signed=False)
-            freq_lgrid2 = int.from_bytes(self._lgrid2(), "big", signed=False)
+            freq_lgrid = unpack_u16(self._lgrid())[0]
+            freq_lgrid2 = unpack_u16(self._lgrid2())[0]
 
         except ExecutionError as ee:
             self.nop()
@@ -582,9 +641,8 @@ class ITLA13(ITLABase):
         :returns:
 
         """
-        grid_freq = str(int(grid_freq * 1000))
-        data = int(grid_freq[0:4])
-        data_2 = int(grid_freq[4:])
+        # grid takes 0.1 GHz steps and grid2 the remaining MHz
+        data, data_2 = divmod(round(grid_freq * 1000), 100)
 
         self._grid(data)
         self._grid2(data_2)
@@ -595,11 +653,12 @@ class ITLA13(ITLABase):
         :returns: The grid spacing in GHz.
 
         """
-        response = self._grid()
-        grid_freq = int.from_bytes(response, "big", signed=True)
-
-        response = self._grid2()
-        grid2_freq = int.from_bytes(response, "big", signed=True)
+        # both reads go through one transact, see batch_commands
+        response, response2 = self.transact(
+            [(self._registers["grid"], None), (self._registers["grid2"], None)]
+        )
+        grid_freq = unpack_s16(response)[0]
+        grid2_freq = unpack_s16(response2)[0]
 
         return grid_freq * 1e-1 + grid2_freq * 1e-3
 
@@ -612,7 +671,7 @@ class ITLA13(ITLABase):
 
         """
         response = self._age()
-        age = int.from_bytes(response, "big")
+        age = unpack_u16(response)[0]
 
         return f"Age: {age} / 100%"
 
@@ -636,11 +695,8 @@ class ITLA13(ITLABase):
         if channel > 0xFFFFFFFF:
             raise ValueError("Channel must be a 32 bit integer (<=0xFFFFFFFF).")
 
-        # Split the channel choice into two options.
-        channel_hex = f"{channel:08x}"
-
-        channell = int(channel_hex[4:], 16)
-        channelh = int(channel_hex[0:4], 16)
+        # Split the channel into its high and low 16 bits.
+        channelh, channell = divmod(channel, 0x10000)
 
         # Set the channel registers.
         self._channel(channell)
@@ -655,12 +711,15 @@ class ITLA13(ITLABase):
         :returns: channel as an integer.
 
         """
-        # This concatenates the data bytestrings
-        response = self._channelh() + self._channel()
+        # both reads go through one transact, see batch_commands
+        responses = self.transact(
+            [(self._registers["channelh"], None), (self._registers["channel"], None)]
+        )
 
-        channel = int.from_bytes(response, "big")
+        # channelh holds the upper 16 bits of the channel number
+        channelh, channel = (unpack_u16(response)[0] for response in responses)
 
-        return channel
+        return channelh << 16 | channel
 
     def set_fine_tuning(self, ftf):
         """
@@ -684,7 +743,15 @@ class ITLA13(ITLABase):
         # their own timing and check to make sure the laser has reached the
         # desired fine tuning frequency.
         # It WILL throw a "pending" error if the laser is on when setting.
-        self._ftf(ftf)
+        self._fine_tuning = None
+        try:
+            self._ftf(ftf)
+        except CPException:
+            # pending still means the new value was accepted
+            self._fine_tuning = ftf
+            raise
+
+        self._fine_tuning = ftf
 
     def get_fine_tuning(self):
         """
@@ -695,10 +762,12 @@ class ITLA13(ITLABase):
         """
 
         response = self._ftf()
-        ftf = int.from_bytes(response, "big", signed=True)
+        ftf = unpack_s16(response)[0]
+        self._fine_tuning = ftf
 
         return ftf * 1e-3
 
+    @cached_limit
     def get_ftf_range(self):
         """
         Return the maximum and minimum off grid tuning for the laser's frequency.
@@ -707,7 +776,7 @@ class ITLA13(ITLABase):
         """
         response = self._ftfr()
 
-        ftfr = int.from_bytes(response, "big")
+        ftfr = unpack_u16(response)[0]
 
         return ftfr * 1e-3
 
@@ -721,12 +790,7 @@ class ITLA13(ITLABase):
         # get response this should be a long byte string
         response = self._temps()
 
-        data = [
-            int.from_bytes(response[i : i + 2], "big", signed=True) / 100
-            for i in range(0, len(response), 2)
-        ]
-
-        return data
+        return [word / 100 for (word,) in iter_unpack_s16(response)]
 
     def get_currents(self):
         """
@@ -740,12 +804,7 @@ class ITLA13(ITLABase):
         # get response this should be a long byte string
         response = self._currents()
 
-        data = [
-            int.from_bytes(response[i : i + 2], "big", signed=True) / 10
-            for i in range(0, len(response), 2)
-        ]
-
-        return data
+        return [word / 10 for (word,) in iter_unpack_s16(response)]
 
     def get_last_response(self):
         """This function gets the most recent response sent from the laser.
@@ -764,16 +823,7 @@ class ITLA13(ITLABase):
         :param reset: resets/clears latching errors
 
         """
-        response = self._statusf()
-        statusf = int.from_bytes(response, "big")
-
-        logger.debug("Current Status Fatal Error: %d", statusf)
-
-        if reset:
-            data_reset = 0x00FF
-            self._statusf(data_reset)
-
-        return FatalError(statusf)
+        return self._get_status("statusf", FatalError, reset)
 
     def get_error_warning(self, reset=False):
         """
@@ -784,114 +834,86 @@ class ITLA13(ITLABase):
 
         :param reset: resets/clears latching errors
         """
-        response = self._statusw()
-        statusw = int.from_bytes(response, "big")
-
-        logger.debug("Current Status Warning Error: %d", statusw)
-
-        if reset:
-            data_reset = 0x00FF
-            self._statusw(data_reset)
-
-        return WarningError(statusw)
-
+        return self._get_status("statusw", WarningError, reset)
+
+    # Alarm threshold registers and the scale that takes each of them to
+    # the threshold's units. Multi-register thresholds are summed.
+    _threshold_registers = MappingProxyType(
+        {
+            "fatal_power": (("fpowth", 100),),
+            "warning_power": (("wpowth", 100),),
+            # GHz part and then the MHz part
+            "fatal_freq": (("ffreqth", 10), ("ffreqth2", 100)),
+            "warning_freq": (("wfreqth", 10), ("wfreqth2", 100)),
+            "fatal_therm": (("fthermth", 100),),
+            "warning_therm": (("wthermth", 100),),
+        }
+    )
+
+    @cached_threshold
     def get_fatal_power_thresh(self):
         """
         reads maximum plus/minus power deviation in dB for which the fatal alarm is asserted
 
         """
-        response = self._fpowth()
-        pow_fatal = int.from_bytes(response, "big") / 100
-        # correcting for proper order of magnitude
-        return pow_fatal
+        return self._get_threshold("fatal_power")
 
+    @cached_threshold
     def get_warning_power_thresh(self):
         """
         reads maximum plus/minus power deviation in dB for which the warning alarm is asserted
 
         """
-        response = self._wpowth()
-        pow_warn = int.from_bytes(response, "big") / 100
-        # correcting for proper order of magnitude
-        return pow_warn
+        return self._get_threshold("warning_power")
 
+    @cached_threshold
     def get_fatal_freq_thresh(self):
         """
         reads maximum plus/minus frequency deviation in GHz for which the fatal alarm is asserted
 
         """
-        response = self._ffreqth()
-        freq_fatal = int.from_bytes(response, "big") / 10
-        # correcting for proper order of magnitude
-        response2 = self._ffreqth2()
-        freq_fatal2 = int.from_bytes(response2, "big") / 100
-        # get frequency deviation in MHz and add to GHz value
-        return freq_fatal + freq_fatal2
+        return self._get_threshold("fatal_freq")
 
+    @cached_threshold
     def get_warning_freq_thresh(self):
         """
         reads maximum plus/minus frequency deviation in GHz for which the warning alarm is asserted
 
         """
-        response = self._wfreqth()
-        freq_warn = int.from_bytes(response, "big") / 10
-        # correcting for proper order of magnitude
-        response2 = self._wfreqth2()
-        freq_warn2 = int.from_bytes(response2, "big") / 100
-        # get frequency deviation in MHz and add to GHz value
-        return freq_warn + freq_warn2
+        return self._get_threshold("warning_freq")
 
+    @cached_threshold
     def get_fatal_therm_thresh(self):
         """
         reads maximum plus/minus thermal deviation in degree celcius for which the fatal alarm is asserted
 
         """
-        response = self._fthermth()
-        therm_fatal = int.from_bytes(response, "big") / 100
-        # correcting for proper order of magnitude
-        return therm_fatal
+        return self._get_threshold("fatal_therm")
 
+    @cached_threshold
     def get_warning_therm_thresh(self):
         """
         reads maximum plus/minus thermal deviation in degree celcius for which the warning alarm is asserted
         """
-        response = self._wthermth()
-        therm_thresh = int.from_bytes(response, "big") / 100
-        # correcting for proper order of magnitude
-        return therm_thresh
+        return self._get_threshold("warning_therm")
 
     def get_srq_trigger(self):
         """
         Utilizes SRQT register to identify why SRQ was asserted in StatusF and StatusW registers
 
         """
-        response = self._srqt()
-        status = int.from_bytes(response, "big")
-
-        logger.debug("SRQT Status: %d", status)
-
-        return SQRTrigger(status)
+        return self._get_status("srqt", SQRTrigger)
 
     def get_fatal_trigger(self):
         """
         Utilizes FatalT register to identify which fatal conditon was asserted in StatusF and StatusW registers
 
         """
-        response = self._fatalt()
-        status = int.from_bytes(response, "big")
-
-        logger.debug("FatalT Status: %d", status)
-
-        return FatalTrigger(status)
+        return self._get_status("fatalt", FatalTrigger)
 
     def get_alm_trigger(self):
         """
         Utilizes ALMT register to identify why ALM was asserted in StatusF and StatusW registers
 
         """
-        response = self._almt()
-        status = int.from_bytes(response, "big")
-
-        logger.debug("AlarmT Status: %d", status)
-
-        return AlarmTrigger(status)
+        return self._get_status("almt", AlarmTrigger)
@@ -1,4 +1,6 @@
+from collections import namedtuple
 from enum import IntFlag, auto
+from functools import lru_cache
 
 
 class Resena(IntFlag):
@@ -132,3 +134,61 @@ class AlarmTrigger(IntFlag):
     _13 = auto()
     _14 = auto()
     _15 = auto()
+
+
+# the thermal thresholds (degrees C) and trigger flags read together by
+# get_status_bundle
+StatusSnapshot = namedtuple(
+    "StatusSnapshot",
+    ["fatal_therm", "warning_therm", "srq_trigger", "fatal_trigger", "alm_trigger"],
+)
+
+
+@lru_cache(maxsize=1024)
+def _as_flag(flag_class, value):
+    """Makes the flag_class instance for a register value. Creating an
+    IntFlag from a value goes through the enum machinery each time, a
+    polled register usually reads back the same few values so they are cached."""
+    return flag_class(value)
+
+
+@lru_cache(maxsize=None)
+def _bit_names(flag_class):
+    """Builds a tuple of the names of a flag class's bits, indexed by bit
+    number, with None for the reserved bits. Built once per class."""
+    names = [None] * 16
+
+    for member in flag_class:
+        if not member.name.startswith("_"):
+            names[member.value.bit_length() - 1] = member.name
+
+    return tuple(names)
+
+
+def asserted(flags):
+    """Lists the names of the bits that are set in a status/trigger flag.
+
+    Only the set bits are visited and the unnamed reserved bits
+    (_4, _13, ...) are skipped.
+
+    :param flags: a flag such as the one returned by `get_srq_trigger`
+    :returns: a list of the names of the set bits, lowest bit first
+    """
+    return list(_asserted(type(flags), int(flags)))
+
+
+@lru_cache(maxsize=1024)
+def _asserted(flag_class, mask):
+    """Does the work for `asserted`. A polled status register usually
+    reads back the same few values so results are cached."""
+    bit_names = _bit_names(flag_class)
+    names = []
+
+    while mask:
+        bit = mask & -mask
+        name = bit_names[bit.bit_length() - 1]
+        if name is not None:
+            names.append(name)
+        mask ^= bit
+
+    return tuple(names)
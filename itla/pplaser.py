@@ -2,9 +2,13 @@ from time import sleep
 
 from .itla12 import ITLA12
 from .itla_errors import *
+from .utils import unpack_u16
 
+# low noise modes indexed by the value of the mode register
+_MODES = ("normal", "nodither", "whisper")
 
-class PPLaser(ITLA12):
+
+class PPLaser(ITLA12, register_files=["registers_pp.yaml"]):
     """
     The pure photonics laser class implements specific features or handles particular
     quirks of the pure photonics laser. The pure photonics laser has additional
@@ -14,21 +18,18 @@ class PPLaser(ITLA12):
     * `get_frequency` is *not* overridden because these registers can still be read without issue
     """
 
-    def __init__(self, serial_port, baudrate=9600, sleep_time=0.1):
+    def __init__(self, serial_port, baudrate=9600, sleep_time=None, profile="default"):
         """sets up the additional frequency max and min variables which will be set upon
         connecting to the laser. We have found that Pure Photonics lasers do not
         return the RVEError when setting the frequency out of spec.
 
-        This sets up the additional register yaml file for pure photonics specific functions.
+        The additional pure photonics specific registers are installed on the class
+        from their own register yaml file when the class is defined.
         """
-        register_files = ["registers_pp.yaml"]
-
         self._frequency_max = None
         self._frequency_min = None
 
-        super().__init__(
-            serial_port, baudrate, register_files=register_files, sleep_time=sleep_time
-        )
+        super().__init__(serial_port, baudrate, sleep_time=sleep_time, profile=profile)
 
     def connect(self):
         """Overriden connect function with query for max and min frequency"""
@@ -57,12 +58,9 @@ class PPLaser(ITLA12):
 
     def get_mode(self):
         """get which low noise mode"""
-        modes = {0: "normal", 1: "nodither", 2: "whisper"}
-
         response = self._mode()
-        response = int.from_bytes(response, "big")
 
-        return modes[response]
+        return _MODES[unpack_u16(response)[0]]
 
     def normalmode(self):
         """set mode to standard dither mode"""
@@ -88,9 +86,7 @@ class PPLaser(ITLA12):
         (Basically it will be centered at the current frequency.)
         """
         response = self._csrange()
-        cs_amplitude = int.from_bytes(response, "big")
-
-        return cs_amplitude
+        return unpack_u16(response)[0]
 
     def set_cleansweep_amplitude(self, range_GHz):
         """Sets the amplitude of the clean sweep.
@@ -154,8 +150,7 @@ class PPLaser(ITLA12):
     def get_cleansweep_rate(self):
         """Gets the clean sweep rate. not sure about units."""
         response = self._csrate()
-        cs_rate = int.from_bytes(response, "big")
-        return cs_rate
+        return unpack_u16(response)[0]
 
     def set_cleansweep_rate(self, rate_MHz):
         """sets the cleansweep rate in MHz/sec
@@ -189,9 +184,10 @@ class PPLaser(ITLA12):
         Set the size of the jump in THz to the fourth decimal place.
         XXX.XXXX
         """
-        freq_jump = str(freq_jump * 10000)
-        self._cjthz(int(freq_jump[0:3]))
-        self._cjghz(int(freq_jump[3:]))
+        # THz and 0.1 GHz parts, ie. 195.3452 THz is written as 195 and 3452
+        cjthz, cjghz = divmod(round(freq_jump * 10000), 10000)
+        self._cjthz(cjthz)
+        self._cjghz(cjghz)
 
     def cleanjump_calibration(self, fcf, grid, pwr, n_jumppoints, confirmation=None):
         """
@@ -217,10 +213,7 @@ class PPLaser(ITLA12):
         print(
             f"You are calibrating {n_jumppoints} clean jump setpoints",
             f"at frequencies:\n{calibration_points}(THz).",
-            f"With power = {pwr}(dBm).",
-        )
-        print(
-            "Write these down in your lab notebook because",
+            f"With power = {pwr}(dBm).\nWrite these down in your lab notebook because",
             "you cannot query the device for these values later.",
         )
 
@@ -251,6 +244,6 @@ class PPLaser(ITLA12):
         while is_calibrating:
             response = self._cjcalibration()
 
-            response_bits = [bit for bit in f"{response:08}"].reverse()
-            is_calibrating = bool(response_bits[15])
+            # bit 15 stays set while the calibration is running
+            is_calibrating = bool(unpack_u16(response)[0] >> 15 & 1)
             sleep(1)
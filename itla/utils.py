@@ -1,5 +1,14 @@
+import struct
+
 import yaml
 
+# decode the 2 data bytes of a response. struct does this in C without
+# the keyword argument parsing of int.from_bytes.
+unpack_u16 = struct.Struct(">H").unpack
+unpack_s16 = struct.Struct(">h").unpack
+# for responses made up of several signed words
+iter_unpack_s16 = struct.Struct(">h").iter_unpack
+
 
 def setup_registers():
     with open("registers.yaml", "r") as yaml_file:
@@ -32,19 +41,51 @@ def get_hexstring(register, data, header):
 def compute_checksum(hexstring):
     """Computes the command checksum
 
-    :param register: the register to write to
-    :param data: the data to write the register
-    :param write: whether or not you are writing to the register
+    :param hexstring: the hexstring for the 4 byte frame
+    :returns: the checksum value
+
+    """
+    return compute_checksum_bytes(bytes.fromhex(hexstring))
+
+
+def compute_checksum_bytes(frame):
+    """Computes the BIP-4 checksum of a 4 byte frame.
+
+    The upper nibble of the first byte is where the checksum lives
+    so it is ignored here.
+
+    :param frame: the 4 byte frame as bytes or a bytearray
     :returns: the checksum value
 
     """
-    # get the hexstring for the command without the
+    bip8 = (frame[0] & 0x0F) ^ frame[1] ^ frame[2] ^ frame[3]
 
-    byte_list = bytes.fromhex(hexstring)
+    return (bip8 ^ (bip8 >> 4)) & 0x0F
 
-    bip8 = byte_list[0] & 15 ^ byte_list[1] ^ byte_list[2] ^ byte_list[3]
 
-    return (bip8 & 240) >> 4 ^ bip8 & 15
+def insert_checksums(frames):
+    """Sets the checksum nibble of every frame in a buffer of 4 byte frames.
+
+    Rather than looping over the frames the whole buffer is treated as one
+    big integer and the bytes of every frame are xor folded together at once.
+    The checksum nibbles of the frames passed in must be zero.
+
+    :param frames: the concatenated frames as bytes or a bytearray
+    :returns: the frames with their checksums filled in as bytes
+
+    """
+    n_frames = len(frames) // 4
+    lanes = int.from_bytes(frames, "big")
+
+    # fold each 4 byte lane down into its lowest nibble
+    fold = lanes ^ (lanes >> 16)
+    fold ^= fold >> 8
+    fold ^= fold >> 4
+
+    low_nibbles = int.from_bytes(b"\x00\x00\x00\x0f" * n_frames, "big")
+    lanes |= (fold & low_nibbles) << 28
+
+    return lanes.to_bytes(4 * n_frames, "big")
 
 
 def form_packet(register, data, write=False):
@@ -63,10 +104,8 @@ def form_packet(register, data, write=False):
     if not isinstance(write, bool):
         raise TypeError("The variable `write` must be True or False")
 
-    hexstring = get_hexstring(register, data, write)
-    checksum = compute_checksum(hexstring)
-    header = checksum * 16 + write
-
-    hexstring = get_hexstring(register, data, header)
+    # the frame is built and checksummed as bytes and only turned into
+    # a hexstring at the end
+    frame = insert_checksums(struct.pack(">BBH", write, register, data))
 
-    return hexstring
+    return frame.hex()
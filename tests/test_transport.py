@@ -0,0 +1,312 @@
+"""Tests for the serial transport using a fake laser in place of the port."""
+
+import unittest
+from time import monotonic, sleep
+from unittest import mock
+
+from serial.serialutil import SerialTimeoutException
+
+import itla
+from itla.itla_errors import ExecutionError
+from itla.utils import compute_checksum_bytes, insert_checksums
+
+
+def bip4(frame):
+    """Reference BIP-4 checksum, written out the long way."""
+    bip8 = (frame[0] & 0x0F) ^ frame[1] ^ frame[2] ^ frame[3]
+    return ((bip8 & 0xF0) >> 4) ^ (bip8 & 0x0F)
+
+
+class FakeSerial:
+    """Answers command frames the way an ITLA would.
+
+    Registers hold plain values. Reading one of the AEA registers in
+    `strings` answers with an AEA status and the string is then read
+    through AEA-EAR (0x0B). `errors` holds (register, write) pairs that
+    answer XE instead, NOP (0x00) then reports `xe_code`.
+    """
+
+    def __init__(self):
+        self.regs = {}
+        self.strings = {0x02: b"ACME Lasers\x00"}
+        self.errors = set()
+        self.xe_code = 0x03
+        self.error_code = 0
+        self.aea = b""
+        self.rx = bytearray()
+        self.writes = []
+        self.drop = 0
+        self.timeout = None
+        self.is_open = True
+
+    def respond(self, status, register, data):
+        frame = bytearray([status, register, data >> 8, data & 0xFF])
+        frame[0] |= bip4(frame) << 4
+        self.rx += frame
+
+    def write(self, data):
+        self.writes.append(bytes(data))
+
+        for i in range(0, len(data), 4):
+            frame = data[i : i + 4]
+            assert frame[0] >> 4 == bip4(frame), "bad checksum"
+            write, register = frame[0] & 0x01, frame[1]
+            value = frame[2] << 8 | frame[3]
+
+            if (register, write) in self.errors:
+                self.error_code = self.xe_code
+                self.respond(0x01, register, 0)
+            elif register == 0x00:
+                self.respond(0x00, register, self.error_code)
+                self.error_code = 0
+            elif register in self.strings and not write:
+                self.aea = self.strings[register]
+                self.respond(0x02, register, len(self.aea))
+            elif register == 0x0B:
+                chunk, self.aea = self.aea[:2].ljust(2, b"\x00"), self.aea[2:]
+                self.respond(0x00, register, int.from_bytes(chunk, "big"))
+            else:
+                if write:
+                    self.regs[register] = value
+                self.respond(0x00, register, self.regs.get(register, 0))
+
+        # lose the last `drop` bytes of the responses to this write
+        if self.drop:
+            del self.rx[-self.drop :]
+
+        return len(data)
+
+    def read(self, size):
+        if len(self.rx) < size:
+            # a real port waits out the timeout for the missing bytes
+            sleep(self.timeout)
+
+        data = bytes(self.rx[:size])
+        del self.rx[:size]
+        return data
+
+    def reset_input_buffer(self):
+        self.rx.clear()
+
+    def close(self):
+        self.is_open = False
+
+
+def make_laser(version="1.3", batch_commands=False, **kwargs):
+    laser = itla.ITLA("fake", 9600, version=version, **kwargs)
+    laser._device = FakeSerial()
+    laser.batch_commands = batch_commands
+    return laser
+
+
+def sent(device, register, write=0):
+    """Counts the frames sent to a register, reads by default."""
+    return sum(
+        data[i + 1] == register and data[i] & 0x01 == write
+        for data in device.writes
+        for i in range(0, len(data), 4)
+    )
+
+
+class TestChecksums(unittest.TestCase):
+    def test_insert_checksums_matches_per_frame(self):
+        frames = bytearray()
+        for register in range(0, 256, 7):
+            for data in (0x0000, 0x1234, 0xFFFF, register * 257 & 0xFFFF):
+                frames += bytes([register & 0x01, register, data >> 8, data & 0xFF])
+
+        checked = insert_checksums(frames)
+
+        for i in range(0, len(frames), 4):
+            frame = checked[i : i + 4]
+            self.assertEqual(frame[0] >> 4, bip4(frame))
+            self.assertEqual(frame[0] >> 4, compute_checksum_bytes(frame))
+            self.assertEqual(frame[1:], frames[i + 1 : i + 4])
+
+
+class TestTransact(unittest.TestCase):
+    def test_error_stops_later_commands(self):
+        laser = make_laser()
+        laser._device.errors.add((0x31, 1))
+
+        with self.assertRaises(ExecutionError):
+            laser.transact([(0x31, 100), (0x32, 8)])
+
+        self.assertEqual(laser._device.writes, [laser._device.writes[0]])
+        self.assertNotIn(0x32, laser._device.regs)
+
+    def test_error_in_middle_of_batch(self):
+        laser = make_laser(batch_commands=True)
+        laser._device.errors.add((0x34, 0))
+
+        with self.assertRaises(ExecutionError):
+            laser.transact([(0x31, None), (0x34, None), (0x35, None)])
+
+        # everything went out in one write
+        self.assertEqual([len(write) for write in laser._device.writes], [12])
+
+    def test_set_fcf_error_is_not_swallowed(self):
+        laser = make_laser()
+        # XE on fcf1 with nop reporting no specific error code
+        laser._device.errors.add((0x35, 1))
+        laser._device.xe_code = 0x00
+
+        with self.assertRaises(ExecutionError):
+            laser.set_fcf(193.1234)
+
+        self.assertNotIn(0x36, laser._device.regs)
+        self.assertNotIn(0x67, laser._device.regs)
+
+
+class TestShortReads(unittest.TestCase):
+    def test_short_read_raises_and_clears_input(self):
+        for batch_commands in (False, True):
+            laser = make_laser(batch_commands=batch_commands)
+            laser._device.drop = 2
+
+            with self.assertRaises(SerialTimeoutException):
+                laser.get_grid()
+
+            self.assertEqual(laser._device.rx, bytearray())
+
+            # the next exchange isn't thrown off
+            laser._device.drop = 0
+            laser._device.regs[0x31] = 1000
+            self.assertEqual(laser.get_power_setting(), 10.0)
+
+    def test_lost_response_fails_after_timeout(self):
+        laser = make_laser(profile="low_latency")
+        laser._device.drop = 4
+
+        start = monotonic()
+        with self.assertRaises(SerialTimeoutException):
+            laser.get_power_setting()
+
+        # 50 ms plus about 8 ms for the frame and its response at 9600 baud
+        self.assertLess(monotonic() - start, 0.08)
+
+
+class TestThresholds(unittest.TestCase):
+    def test_two_register_threshold(self):
+        for batch_commands in (False, True):
+            laser = make_laser(batch_commands=batch_commands)
+            # ffreqth is read in steps of 1/10 and ffreqth2 in steps of 1/100
+            laser._device.regs[0x24] = 25
+            laser._device.regs[0x63] = 7
+
+            self.assertEqual(laser.get_threshold_raw("fatal_freq"), 257)
+            self.assertAlmostEqual(laser.get_fatal_freq_thresh(), 25 / 10 + 7 / 100)
+
+
+class TestReadAEA(unittest.TestCase):
+    def test_batched_read_aea(self):
+        laser = make_laser(batch_commands=True)
+
+        self.assertEqual(laser.get_manufacturer(), "ACME Lasers\x00")
+        # the AEA-EAR reads for the 12 byte string went out in one write
+        self.assertEqual([len(write) for write in laser._device.writes], [4, 24])
+
+    def test_read_aea_one_at_a_time(self):
+        laser = make_laser()
+
+        self.assertEqual(laser.get_manufacturer(), "ACME Lasers\x00")
+        self.assertEqual(len(laser._device.writes), 7)
+
+
+class TestFineTuning(unittest.TestCase):
+    def test_ftf_read_once_fine_tuning_is_off(self):
+        for version in ("1.2", "1.3"):
+            laser = make_laser(version)
+            ftf = laser._registers["ftf"]
+
+            laser.set_frequency(193.1)
+            laser.set_frequency(193.2)
+
+            self.assertEqual(sent(laser._device, ftf), 1)
+            self.assertEqual(sent(laser._device, ftf, write=1), 0)
+
+    def test_failed_set_fine_tuning_forgets_the_value(self):
+        for version in ("1.2", "1.3"):
+            laser = make_laser(version)
+            ftf = laser._registers["ftf"]
+            laser.get_fine_tuning()
+            laser._device.errors.add((ftf, 1))
+
+            with self.assertRaises(ExecutionError):
+                laser.set_fine_tuning(1.5)
+
+            laser.set_frequency(193.1)
+            self.assertEqual(sent(laser._device, ftf), 2)
+
+    def test_reset_forgets_the_value(self):
+        for version in ("1.2", "1.3"):
+            for reset in ("hard_reset", "soft_reset"):
+                laser = make_laser(version)
+                ftf = laser._registers["ftf"]
+                laser.get_fine_tuning()
+
+                getattr(laser, reset)()
+
+                laser.set_frequency(193.1)
+                self.assertEqual(sent(laser._device, ftf), 2)
+
+    def test_connect_forgets_the_value(self):
+        laser = make_laser()
+        ftf = laser._registers["ftf"]
+        laser.get_fine_tuning()
+
+        device = FakeSerial()
+        with mock.patch("serial.Serial", return_value=device):
+            laser.connect()
+
+        laser.set_frequency(193.1)
+        self.assertEqual(sent(device, ftf), 1)
+
+
+class TestDither(unittest.TestCase):
+    def test_dither_enable_payloads(self):
+        payloads = {
+            "sinusoidal": 0x02,
+            "sinusoid": 0x02,
+            "sin": 0x02,
+            "Sinusoidal": 0x02,
+            "triangular": 0x12,
+            "tri": 0x12,
+        }
+
+        for version in ("1.2", "1.3"):
+            laser = make_laser(version)
+            dithere = laser._registers["dithere"]
+
+            for waveform, payload in payloads.items():
+                laser.dither_enable(waveform)
+                self.assertEqual(laser._device.regs[dithere], payload, waveform)
+
+    def test_unknown_waveform(self):
+        for version in ("1.2", "1.3"):
+            laser = make_laser(version)
+
+            with self.assertRaises(ValueError):
+                laser.dither_enable("square")
+
+            self.assertEqual(laser._device.writes, [])
+
+
+class TestCleanJump(unittest.TestCase):
+    def test_set_cleanjump_split(self):
+        laser = itla.PPLaser("fake")
+        laser._device = FakeSerial()
+        cjthz, cjghz = laser._registers["cjthz"], laser._registers["cjghz"]
+
+        for freq_jump, split in (
+            (195.3452, (195, 3452)),
+            (193.0001, (193, 1)),
+            (0.05, (0, 500)),
+        ):
+            laser.set_cleanjump(freq_jump)
+            registers = laser._device.regs[cjthz], laser._device.regs[cjghz]
+            self.assertEqual(registers, split, freq_jump)
+
+
+if __name__ == "__main__":
+    unittest.main()